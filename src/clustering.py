@@ -20,9 +20,40 @@ k where diminishing returns on J start to flatten out.
 from __future__ import annotations
 
 import numpy as np
+from scipy.sparse import issparse
 from sklearn.cluster import KMeans
 
 
+# ── Input layout ───────────────────────────────────────────────────
+
+# thresholds for handing K-Means a dense array instead of the sparse matrix
+_DENSE_MAX_FEATURES = 2048
+_DENSE_MIN_DENSITY = 0.10
+
+
+def _as_kmeans_input(tfidf_matrix):
+    """
+    Lay the TF-IDF matrix out the way sklearn's K-Means runs fastest.
+
+    Lloyd/Elkan iterate over samples, so they want a dense, C-contiguous
+    (sample-major) array.  Densify when that's cheap — a small vocabulary
+    or a fairly full matrix; large, very sparse inputs stay in CSR form.
+
+    The dense copy is float64, not float32: K-Means is a local search, and
+    float32 rounding in the distance sums is enough to flip it into a
+    different local minimum (and a different summary).  float64 gives the
+    same labels as the sparse input.
+    """
+    if not issparse(tfidf_matrix):
+        return np.ascontiguousarray(tfidf_matrix, dtype=np.float64)
+
+    n_rows, n_cols = tfidf_matrix.shape
+    density = tfidf_matrix.nnz / (n_rows * n_cols) if n_cols else 0.0
+    if n_cols < _DENSE_MAX_FEATURES or density > _DENSE_MIN_DENSITY:
+        return np.ascontiguousarray(tfidf_matrix.toarray(), dtype=np.float64)
+    return tfidf_matrix
+
+
 # ── Cluster assignment ─────────────────────────────────────────────
 
 def cluster_sentences(
@@ -50,7 +81,7 @@ def cluster_sentences(
         n_init=10,
         max_iter=300,
     )
-    return km.fit_predict(tfidf_matrix)
+    return km.fit_predict(_as_kmeans_input(tfidf_matrix))
 
 
 # ── Optimal k via the elbow heuristic ──────────────────────────────
@@ -85,11 +116,14 @@ def optimal_k(
         max_k = max(3, n // 2)
     max_k = min(max_k, n - 1)  # can't have more clusters than sentences
 
+    # convert once up front rather than inside every fit below
+    X = _as_kmeans_input(tfidf_matrix)
+
     ks = list(range(2, max_k + 1))
     inertias = []
     for k in ks:
         km = KMeans(n_clusters=k, random_state=random_state, n_init=5, max_iter=200)
-        km.fit(tfidf_matrix)
+        km.fit(X)
         inertias.append(km.inertia_)
 
     # second-derivative approach to find the elbow
@@ -112,7 +146,7 @@ def select_representative_sentences(
     sentence_scores: np.ndarray,
 ) -> list[str]:
     """
-    From each cluster pick the sentence with the highest TF-IDF score,
+    From each cluster pick the sentence with the highest importance score,
     then return them in their original document order.
 
     This preserves narrative flow — the summary reads like a natural
@@ -122,26 +156,28 @@ def select_representative_sentences(
     ----------
     sentences       : original sentence list
     labels          : cluster id per sentence (from `cluster_sentences`)
-    sentence_scores : per-sentence TF-IDF importance score
+    sentence_scores : per-sentence importance score
 
     Returns
     -------
     list[str]
         Selected sentences, ordered by their position in the document.
     """
-    selected_indices: list[int] = []
-
-    for cluster_id in range(labels.max() + 1):
-        member_mask = labels == cluster_id
-        member_indices = np.where(member_mask)[0]
+    # One O(n) pass over all sentences instead of a full `labels == k`
+    # scan per cluster: per-cluster maximum via an unbuffered ufunc, then
+    # the first sentence in each cluster that reaches it (same tie-break
+    # as np.argmax).
+    labels = np.asarray(labels)
+    sentence_scores = np.asarray(sentence_scores)
 
-        if len(member_indices) == 0:
-            continue  # empty cluster (rare, but possible)
+    best_score = np.full(labels.max() + 1, -np.inf)
+    np.maximum.at(best_score, labels, sentence_scores)
 
-        # pick the highest-scoring member
-        best = member_indices[np.argmax(sentence_scores[member_indices])]
-        selected_indices.append(int(best))
+    candidates = np.flatnonzero(sentence_scores == best_score[labels])
+    # candidates are in document order, so the first hit per label wins;
+    # empty clusters simply never show up here
+    _, first = np.unique(labels[candidates], return_index=True)
 
     # sort by position so the summary follows original order
-    selected_indices.sort()
-    return [sentences[i] for i in selected_indices]
\ No newline at end of file
+    selected_indices = np.sort(candidates[first])
+    return [sentences[i] for i in selected_indices]
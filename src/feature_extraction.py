@@ -15,19 +15,40 @@ For a term *t* in sentence (document) *d* within a corpus *D* of *N* docs:
 
     tfidf(t, d) = tf(t, d) * idf(t, D)
 
-Scikit-learn's TfidfVectorizer applies L2 row-normalisation by default so
+Scikit-learn's TfidfTransformer applies L2 row-normalisation by default so
 each sentence vector has unit length.  This lets us use the dot product
 directly as cosine similarity later on.
+
+Terms are mapped to columns with the *hashing trick* (HashingVectorizer)
+rather than a fitted vocabulary: each document is summarised on its own
+and the vocabulary is never reused, so building a Python dict of terms
+on every call is wasted work.
 """
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity as _cosine_similarity
+from scipy.sparse import csr_matrix, issparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+from src.preprocess import extract_terms
+
+
+_MAX_DF = 0.95  # ignore terms appearing in >95 % of sentences
+
+# stateless, so a single module-level instance can be shared
+_HASHER = HashingVectorizer(
+    # reuse our own (cached) term extractor: lowercasing, tokenizing and
+    # stop-word removal happen in one pass per sentence
+    analyzer=extract_terms,
+    n_features=2**18,
+    alternate_sign=False,  # raw counts — TfidfTransformer expects tf >= 0
+    norm=None,             # normalise after IDF weighting, not before
+    dtype=np.float32,
+)
 
 
 def build_tfidf_matrix(
     sentences: list[str],
-) -> tuple[np.ndarray, TfidfVectorizer]:
+) -> tuple[csr_matrix, TfidfTransformer]:
     """
     Build a TF-IDF matrix from a list of sentence strings.
 
@@ -38,25 +59,71 @@ def build_tfidf_matrix(
 
     Returns
     -------
-    tfidf_matrix : sparse CSR matrix, shape (n_sentences, n_features)
-    vectorizer   : fitted TfidfVectorizer (useful for inspection / vocab)
+    tfidf_matrix : sparse CSR matrix (float32), shape (n_sentences, n_features)
+    transformer  : fitted TfidfTransformer (holds the ``idf_`` weights)
+
+    Raises
+    ------
+    ValueError
+        If no term survives stop-word removal and max_df pruning.
+
+    Notes
+    -----
+    The matrix is stored as float32.  TF-IDF weights are small positive
+    numbers (each row has unit length), so scores and similarities match
+    the float64 version to within ~1e-6 while using half the memory.
+
+    Because terms are hashed there is no ``vocabulary_`` to inspect.
+    Hash buckets no sentence uses are dropped, so ``n_features`` is the
+    number of hash buckets kept (distinct terms, up to hash collisions),
+    not 2**18.  Two terms that collide share one column, and with it
+    their document frequency and IDF weight.
+    """
+    counts = _HASHER.transform(sentences)
+
+    # keep only buckets that occur, and not in (almost) every sentence —
+    # the same pruning TfidfVectorizer's max_df does on its vocabulary
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    keep = np.flatnonzero((df > 0) & (df <= _MAX_DF * counts.shape[0]))
+    if keep.size == 0:
+        raise ValueError(
+            "No terms remain after stop-word removal and max_df pruning; "
+            "the sentences contain only stop words or shared terms."
+        )
+    counts = counts[:, keep]
+
+    transformer = TfidfTransformer(sublinear_tf=True)  # apply 1 + log(tf) dampening
+    tfidf_matrix = transformer.fit_transform(counts)
+    return tfidf_matrix, transformer
+
+
+def fit_tfidf_matrix(sentences: list[str]) -> csr_matrix:
+    """
+    Like `build_tfidf_matrix`, but return only the TF-IDF matrix.
+
+    The fitted transformer is dropped as soon as the matrix is built, so
+    callers that never inspect it (e.g. `summarize`) don't keep it alive
+    through clustering.
     """
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_df=0.95,        # ignore terms appearing in >95 % of sentences
-        min_df=1,           # keep singletons — sentences are short
-        sublinear_tf=True,  # apply 1 + log(tf) dampening
-    )
-    tfidf_matrix = vectorizer.fit_transform(sentences)
-    return tfidf_matrix, vectorizer
+    tfidf_matrix, _ = build_tfidf_matrix(sentences)
+    return tfidf_matrix
 
 
 def get_sentence_scores(tfidf_matrix) -> np.ndarray:
     """
-    Score each sentence by the mean TF-IDF value across its terms.
+    Score each sentence by the number of distinct informative terms it has.
+
+    "Informative" means the term survived stop-word removal and the
+    max-df pruning in `build_tfidf_matrix`, i.e. it has a non-zero TF-IDF
+    weight.  Sentences that cover more content words rank higher.
+
+    Strictly this counts non-zero hash buckets, so two terms of the same
+    sentence that hash to the same bucket are counted once.
 
-    A higher score indicates that the sentence contains more *informative*
-    (i.e., less common) words relative to the rest of the document.
+    This is just the per-row non-zero count of the CSR matrix, read off
+    ``indptr`` — no arithmetic on the TF-IDF values themselves.  (Their
+    squared sum is 1 for every row after L2 normalisation, so magnitude-
+    based scores carry little beyond this count anyway.)
 
     Parameters
     ----------
@@ -64,11 +131,10 @@ def get_sentence_scores(tfidf_matrix) -> np.ndarray:
 
     Returns
     -------
-    scores : ndarray, shape (n_sentences,)
+    scores : ndarray (float32), shape (n_sentences,)
+        0.0 for sentences with no terms left after stop-word removal.
     """
-    # .mean(axis=1) returns a matrix; flatten to 1-D
-    scores = np.asarray(tfidf_matrix.mean(axis=1)).flatten()
-    return scores
+    return np.diff(tfidf_matrix.tocsr().indptr).astype(np.float32)
 
 
 def compute_similarity_matrix(tfidf_matrix) -> np.ndarray:
@@ -80,9 +146,24 @@ def compute_similarity_matrix(tfidf_matrix) -> np.ndarray:
 
         sim(s_i, s_j) = s_i · s_j
 
+    so the whole matrix is just the Gram product X · Xᵀ — no need to
+    re-normalise the rows the way sklearn's ``cosine_similarity`` does.
+
+    Parameters
+    ----------
+    tfidf_matrix : sparse or dense matrix, shape (n_sentences, n_features)
+
     Returns
     -------
-    sim_matrix : ndarray, shape (n_sentences, n_sentences)
-        Values in [0, 1] — 1 means identical direction.
+    sim_matrix : C-contiguous float32 ndarray, shape (n_sentences, n_sentences)
+        Symmetric, values in [0, 1] — 1 means identical direction.
     """
-    return _cosine_similarity(tfidf_matrix)
\ No newline at end of file
+    if issparse(tfidf_matrix):
+        X = tfidf_matrix.astype(np.float32)
+        # sparse @ sparse only multiplies the stored entries
+        return (X @ X.T).toarray()
+
+    X = np.ascontiguousarray(tfidf_matrix, dtype=np.float32)
+    # NumPy spots the X @ X.T pattern and calls BLAS syrk, which computes
+    # one triangle and mirrors it — half the work of a general matmul
+    return X @ X.T
\ No newline at end of file
@@ -2,9 +2,13 @@
 Text preprocessing module.
 
 Handles three main jobs:
-  1. Downloading NLTK resources (punkt tokenizer, stopwords list).
+  1. Downloading NLTK resources (stopwords list).
   2. Cleaning raw text — collapsing whitespace, stripping junk chars.
   3. Splitting text into sentences and optionally tokenizing words.
+
+Sentence and word splitting use pre-compiled regular expressions rather
+than NLTK's Punkt / word_tokenize — a single C-level regex scan is far
+cheaper than Punkt's pure-Python state machine.
 """
 
 import re
@@ -24,7 +28,6 @@ else:
     ssl._create_default_https_context = _create_unverified_https_context
 
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
 
 # ── NLTK resource management ───────────────────────────────────────
 
@@ -38,8 +41,6 @@ def ensure_nltk_data() -> None:
         return
 
     resources = {
-        "punkt": "tokenizers/punkt",
-        "punkt_tab": "tokenizers/punkt_tab",
         "stopwords": "corpora/stopwords",
     }
     for name, path in resources.items():
@@ -47,24 +48,68 @@ def ensure_nltk_data() -> None:
             nltk.data.find(path)
         except LookupError:
             nltk.download(name, quiet=True)
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                return  # download failed — leave the flag unset so a later call retries
 
     _NLTK_READY = True
 
 
+# fetch resources once per process, at import, rather than on every call
+# (nltk.download reports a failed download and returns False, it doesn't raise)
+ensure_nltk_data()
+
+
 # cache the stopword set so we don't rebuild it on every call
 @functools.lru_cache(maxsize=1)
 def _get_stop_words() -> frozenset:
-    ensure_nltk_data()
     return frozenset(stopwords.words("english"))
 
 
+# bind the set once at import so the tokenizer doesn't pay a function call
+# per sentence; if the corpus is missing (download failed), leave it unset
+# so the module still imports — removing stop words then raises NLTK's
+# LookupError with its install instructions until ensure_nltk_data()
+# succeeds on a later call
+try:
+    _STOP_WORDS = _get_stop_words()
+except LookupError:
+    _STOP_WORDS = None
+
+
+# ── Compiled patterns ──────────────────────────────────────────────
+
+# candidate sentence boundaries: the whitespace after ., ! or ?, optionally
+# followed by a closing quote/bracket (``end." Next``).  The whitespace is
+# captured so pieces that turn out not to start a sentence can be re-joined.
+_SENT_RE = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"'”’)\]]))(\s+)")
+# opening quotes/brackets allowed before a sentence's first letter
+_OPENERS = "\"'“‘(["
+# any run of whitespace (spaces, tabs, newlines)
+_WS_RE = re.compile(r"\s+")
+# a "word" is a run of letters (same as str.isalpha, so accented words like
+# "café" stay whole) — drops numbers, underscores and punctuation
+_WORD_RE = re.compile(r"[^\W\d_]+")
+# a TF-IDF "term" is any alphanumeric run of 2+ characters — the same
+# default token_pattern TfidfVectorizer uses, so numbers like "2020" count
+_TERM_RE = re.compile(r"\b\w\w+\b")
+
+
 # ── Text cleaning ──────────────────────────────────────────────────
 
+# Both caches below are keyed on the raw string: boilerplate such as
+# headers, footers and repeated captions recurs across documents, and a
+# hit skips the regex work entirely.
+_CACHE_SIZE = 100_000
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def clean_text(text: str) -> str:
     """Collapse whitespace runs and strip leading/trailing spaces."""
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
     return text.strip()
 
 
@@ -72,16 +117,34 @@ def clean_text(text: str) -> str:
 
 def split_sentences(text: str) -> list[str]:
     """
-    Split *text* into sentences using NLTK's Punkt tokenizer.
+    Split *text* into sentences at whitespace following ``.``, ``!`` or ``?``
+    (optionally closed by a quote or bracket) when the next word starts
+    with an uppercase letter, optionally after an opening quote or bracket.
 
     Empty or whitespace-only fragments are dropped automatically.
     """
-    ensure_nltk_data()
-    sentences = sent_tokenize(text)
+    sentences = _split_raw(text)
     # strip each sentence and throw away blanks
     return [s.strip() for s in sentences if s.strip()]
 
 
+def _split_raw(text: str) -> list[str]:
+    # split at every candidate boundary, then glue back pieces that don't
+    # start with an uppercase letter ("e.g. hammers", "3. 4. 5.") — the
+    # isupper() check covers any script, not just A-Z
+    parts = _SENT_RE.split(text)  # [piece, sep, piece, sep, ...]
+    sentences = []
+    current = [parts[0]]
+    for sep, piece in zip(parts[1::2], parts[2::2]):
+        if piece.lstrip(_OPENERS)[:1].isupper():
+            sentences.append("".join(current))
+            current = [piece]
+        else:
+            current += (sep, piece)
+    sentences.append("".join(current))
+    return sentences
+
+
 # ── Word-level tokenization ────────────────────────────────────────
 
 def tokenize_and_clean(
@@ -104,15 +167,32 @@ def tokenize_and_clean(
     list[str]
         Cleaned token list, e.g. ["machine", "learning", "algorithms"].
     """
-    ensure_nltk_data()
-    tokens = word_tokenize(sentence.lower())
-    tokens = [t for t in tokens if t.isalpha()]
+    # a fresh list each call, so callers can't mutate the cached tuple
+    return list(_tokenize_cached(sentence, remove_stopwords))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _tokenize_cached(sentence: str, remove_stopwords: bool) -> tuple[str, ...]:
+    # the regex only matches letters, so no separate isalpha() pass is needed
+    tokens = _WORD_RE.findall(sentence.lower())
+    if not remove_stopwords:
+        return tuple(tokens)
 
-    if remove_stopwords:
-        stop_words = _get_stop_words()
-        tokens = [t for t in tokens if t not in stop_words]
+    stop_words = _STOP_WORDS if _STOP_WORDS is not None else _get_stop_words()
+    return tuple([t for t in tokens if t not in stop_words])
 
-    return tokens
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def extract_terms(sentence: str) -> tuple[str, ...]:
+    """
+    Lowercased TF-IDF terms of a sentence, with English stopwords removed.
+
+    Unlike `tokenize_and_clean`, numbers and other alphanumeric tokens
+    ("2020", "q1") are kept, matching scikit-learn's default tokenizer.
+    Single characters are dropped.  Returns a (cached) tuple.
+    """
+    stop_words = _STOP_WORDS if _STOP_WORDS is not None else _get_stop_words()
+    return tuple([t for t in _TERM_RE.findall(sentence.lower()) if t not in stop_words])
 
 
 # ── Convenience pipeline ───────────────────────────────────────────
@@ -122,14 +202,20 @@ def preprocess_text(text: str) -> tuple[str, list[str]]:
     Run the full preprocessing pipeline on raw input text.
 
     Steps:
-      1. clean_text()   — normalise whitespace
-      2. split_sentences() — NLTK Punkt sentence segmentation
+      1. regex sentence segmentation on the raw text
+      2. clean_text() on each sentence — normalise whitespace
+
+    Splitting first means the whitespace at sentence boundaries is
+    consumed by the split itself, and no cleaned copy of the whole input
+    is built (or kept in clean_text's cache) just to be split again.
 
     Returns
     -------
     tuple[str, list[str]]
         (cleaned_text, list_of_sentences)
     """
-    cleaned = clean_text(text)
-    sentences = split_sentences(cleaned)
+    sentences = [clean_text(s) for s in _split_raw(text)]
+    sentences = [s for s in sentences if s]
+    # same result as clean_text(text): every boundary was whitespace
+    cleaned = " ".join(sentences)
     return cleaned, sentences
\ No newline at end of file
@@ -10,8 +10,8 @@ This is the only module the rest of the app needs to import.
 
 from __future__ import annotations
 
-from src.preprocess import preprocess_text
-from src.feature_extraction import build_tfidf_matrix, get_sentence_scores
+from src.preprocess import preprocess_text, tokenize_and_clean
+from src.feature_extraction import fit_tfidf_matrix, get_sentence_scores
 from src.clustering import cluster_sentences, select_representative_sentences
 
 
@@ -20,13 +20,17 @@ def summarize(text: str, ratio: float = 0.3) -> dict:
     Produce an extractive summary of *text*.
 
     The algorithm:
-      1. Clean text and split into sentences.
+      1. Clean text, split into sentences and drop exact repeats.
       2. Build a TF-IDF matrix (each row = one sentence vector).
-      3. Score sentences by mean TF-IDF value.
+      3. Score sentences by their number of distinct informative terms.
       4. Cluster sentences into *k* groups using K-Means.
       5. From each cluster, pick the highest-scoring sentence.
       6. Return those representatives in document order.
 
+    When only one summary sentence is wanted, or no term survives
+    stop-word removal, steps 2–5 are skipped and the sentence with the
+    most distinct content words is returned.
+
     Parameters
     ----------
     text  : str
@@ -58,17 +62,38 @@ def summarize(text: str, ratio: float = 0.3) -> dict:
             "compression_ratio": 1.0,
         }
 
+    # exact repeats (boilerplate, scraped pages) would only produce
+    # identical rows — keep the first occurrence of each sentence, in order
+    unique_sentences = list(dict.fromkeys(sentences))
+
     # ── determine how many clusters / summary sentences we want ──
     n_clusters = max(1, int(len(sentences) * ratio))
-    n_clusters = min(n_clusters, len(sentences))
-
-    # ── feature extraction ────────────────────────────────────────
-    tfidf_matrix, _vectorizer = build_tfidf_matrix(sentences)
-    scores = get_sentence_scores(tfidf_matrix)
-
-    # ── clustering + representative selection ─────────────────────
-    labels = cluster_sentences(tfidf_matrix, n_clusters)
-    summary_sentences = select_representative_sentences(sentences, labels, scores)
+    n_clusters = min(n_clusters, len(unique_sentences))
+
+    # ── feature extraction ───────────────────────────────────────
+    tfidf_matrix = None
+    if n_clusters > 1:
+        try:
+            tfidf_matrix = fit_tfidf_matrix(unique_sentences)
+        except ValueError:
+            pass  # only stop words / terms shared by every sentence
+
+    if tfidf_matrix is None:
+        # ── fast path: a single cluster ──────────────────────────
+        # K-Means has nothing to separate (one cluster wanted, or no
+        # usable terms), so skip clustering and keep the sentence with
+        # the most distinct content words.
+        summary_sentences = [
+            max(unique_sentences, key=lambda s: len(set(tokenize_and_clean(s))))
+        ]
+    else:
+        scores = get_sentence_scores(tfidf_matrix)
+
+        # ── clustering + representative selection ────────────────
+        labels = cluster_sentences(tfidf_matrix, n_clusters)
+        summary_sentences = select_representative_sentences(
+            unique_sentences, labels, scores
+        )
 
     summary_text = " ".join(summary_sentences)
 
@@ -24,7 +24,7 @@ def char_count(text: str) -> int:
 
 def sentence_count(text: str) -> int:
     """
-    Quick sentence count using NLTK's Punkt tokenizer.
+    Quick sentence count using the regex splitter from ``preprocess``.
 
     Importing here avoids a circular dependency — the rest of
     ``preprocess`` isn't needed.